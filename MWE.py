@@ -1,6 +1,8 @@
+import os
+import sys
+
 import cpmpy as cp
 import numpy as np
-from fractions import Fraction
 
 # Automated tasks (for cycle time calculation)
 automated_tasks = [
@@ -74,84 +76,124 @@ skill_matrix = [
     [0, 1, 1, 0, 1, 1, 0, 0, 0, 0, 0] # Farhadullah
 ]
 
-# A large constant for lexicographic weighting.
-LARGE_WEIGHT = default_num_workers + 1
-
-"""
-Build and solve the model.
-
-Parameters:
-    seq_times: list of floats for each sequential task.
-    auto_times: list of floats for each automated task.
-    skill_matrix: 2D list (num_workers x total_tasks) of booleans.
-                The columns correspond to tasks_for_model (sequential tasks first, then non-sequential tasks).
-    preferred_list: list of booleans (length=num_workers) indicating preferred workers.
-    
-Returns:
-    A dictionary with solution details or None if no solution is found.
-"""
-n_seq = len(seq_times)                   # number of sequential tasks
-total_tasks = len(tasks_for_model)        # total tasks (sequential + non-sequential)
-num_workers = len(skill_matrix)
+# CP-SAT search parameters (names as in OR-Tools' sat_parameters.proto).
+SOLVER_PARAMS = dict(num_search_workers=os.cpu_count() or 8, linearization_level=2, cp_model_probing_level=0, log_search_progress=False)
 
 lay_eva_index = sequential_tasks.index("Lay EVA")
 operate_layup_index = tasks_for_model.index("Operate Lay-up Machine")
 layup_quality_index = sequential_tasks.index("Lay-up quality Check")
 operate_bussing_index = tasks_for_model.index("Operate Bussing Machine")
 
-# Compute the bottleneck cycle time T from the automated tasks.
-# Use Fraction to represent numbers as rational numbers.
-T_frac = max([Fraction(str(t)) for t in auto_times])
-
-# Decision variables:
-# For each task m in tasks_for_model, let x[m] be the number of workers assigned.
-# For sequential tasks, x[m] must be chosen to satisfy the effective time constraint.
-# For non-sequential tasks (e.g. Stringing) we force x[m] == 1.
-x = cp.intvar(1, num_workers, shape=total_tasks)
-
-# For each worker i and task m, assign[i, m] is binary: 1 if worker i is assigned to task m.
-assign = cp.boolvar(shape=(num_workers, total_tasks))
-
-model = cp.Model()
-
-# Constraint 1: For each task, the number of assigned workers equals x[m].
-for m in range(total_tasks):
-    model += cp.sum(assign[i, m] for i in range(num_workers)) == x[m]
-
-# Constraint 2: Each worker can be assigned to at most one task.
-for i in range(num_workers):
-    model += (sum(assign[i, m] for m in range(total_tasks) if m not in [operate_bussing_index, operate_layup_index]) <= 1)
-
-# Constraint 3: A worker may only be assigned to a task if they are skilled.
-for i in range(num_workers):
-    for m in range(total_tasks):
-        if not skill_matrix[i][m]:
-            model += (assign[i, m] == 0)
-
-# Constraint 4: Task-specific constraints.
-for m in range(total_tasks):
-    if m < n_seq:
-        # For sequential tasks, enforce: base_time <= T * x[m]
-        # For "Wash Glass" (assumed at index 0) we need to wash 2 glasses per panel.
-        m_frac = Fraction(str(seq_times[m]))
-        multiplier = 2 if m == 0 else 1
-        model += (multiplier * m_frac.numerator * T_frac.denominator <= T_frac.numerator * m_frac.denominator * x[m])
-
-# Constraint 5: Additional constraints for non-sequential tasks.
-model += cp.sum([assign[i, lay_eva_index] & assign[i, operate_layup_index] for i in range(num_workers)]) >= 1
-model += cp.sum([assign[i, layup_quality_index] & assign[i, operate_bussing_index] for i in range(num_workers)]) >= 1
-
-# --- Introduce worker "used" variables for preference tracking ---
-used = cp.boolvar(shape=num_workers)
-for i in range(num_workers):
-    model += (cp.sum([assign[i, m] for m in range(total_tasks)]) >= 1).implies(used[i])
-
-# --- Objective: Minimize total workers used (primary) and then penalize using non-preferred workers.
-obj = LARGE_WEIGHT * sum(used[i] for i in range(num_workers)) \
-            + sum(used[i] for i in range(num_workers))
-model.minimize(obj)
-
-if model.solve():
-    print(assign.value())
-else:
-    print("No solution found.")
\ No newline at end of file
+def build_solver(seq_times, auto_times, skill_matrix, solver="ortools"):
+    """
+    Build the model and load it into a persistent OR-Tools solver.
+
+    Parameters:
+        seq_times: list of floats for each sequential task.
+        auto_times: list of floats for each automated task.
+        skill_matrix: 2D list (num_workers x total_tasks) of booleans.
+                    The columns correspond to tasks_for_model (sequential tasks first, then non-sequential tasks).
+        solver: name of the CPMpy backend. The model is linear over Booleans and small integers, so
+                pseudo-Boolean solvers such as "exact" can load it as well.
+
+    Returns:
+        A tuple (solver, assign). The model is transformed only once, when the solver is created;
+        solver.solve() can then be called repeatedly, and extra constraints can be added
+        incrementally with solver += constraint instead of rebuilding the model.
+    """
+    n_seq = len(seq_times)                   # number of sequential tasks
+    total_tasks = len(tasks_for_model)        # total tasks (sequential + non-sequential)
+    num_workers = len(skill_matrix)
+
+    # Compute the bottleneck cycle time T from the automated tasks.
+    # All times are given with one decimal, so scaling by SCALE turns them into integers.
+    SCALE = 10
+    T_int = max(round(t * SCALE) for t in auto_times)
+    seq_int = [round(t * SCALE) for t in seq_times]
+
+    # Decision variables:
+    # For each task m in tasks_for_model, let x[m] be the number of workers assigned.
+    # For sequential tasks, x[m] must be chosen to satisfy the effective time constraint.
+    # For non-sequential tasks (e.g. Stringing) we force x[m] == 1 through its domain.
+    # The effective time constraint base_time <= T * x[m] only involves constants, so it is
+    # applied directly as the lower bound of x[m]: x[m] >= ceil(base_time / T).
+    # For "Wash Glass" (assumed at index 0) we need to wash 2 glasses per panel.
+    # No task can have more workers than there are workers skilled for it, which bounds x[m] from above.
+    # If a task needs more workers than that, the lower bound is capped at the upper bound (a domain cannot be
+    # empty) and posted as a constraint below instead, so the solver reports the instance as infeasible.
+    skill_np = np.array(skill_matrix, dtype=bool)
+    skilled_count = skill_np.sum(axis=0)
+    x_lb = [max(1, -(-(2 if m == 0 else 1) * seq_int[m] // T_int)) for m in range(n_seq)]
+    x_seq = [cp.intvar(min(x_lb[m], int(skilled_count[m])), int(skilled_count[m])) for m in range(n_seq)]
+    x_nonseq = [cp.intvar(1, 1) for m in range(n_seq, total_tasks)]
+    x = cp.cpm_array(x_seq + x_nonseq)
+
+    # For each worker i and task m, assign[i, m] is binary: 1 if worker i is assigned to task m.
+    # Unskilled cells are the constant False instead of a variable, so they never reach the solver.
+    assign = np.full((num_workers, total_tasks), cp.BoolVal(False), dtype=object)
+    assign[skill_np] = cp.boolvar(shape=int(skill_np.sum()))
+    assign = cp.cpm_array(assign)
+
+    model = cp.Model()
+    model += [x_seq[m] >= x_lb[m] for m in range(n_seq) if x_lb[m] > skilled_count[m]]
+
+    # Columns that count towards the "one task per worker" limit (machine operation is done on the side).
+    mask_cols = np.ones(total_tasks, dtype=bool)
+    mask_cols[[operate_bussing_index, operate_layup_index]] = False
+
+    # Constraint 1: For each task, the number of assigned workers equals x[m].
+    model += (assign.sum(axis=0) == x)
+
+    # Constraint 2: Each worker can be assigned to at most one task.
+    # CP-SAT turns each of these sums of Booleans into a native at-most-one constraint, so no task-index
+    # variable per worker is needed.
+    model += (assign[:, mask_cols].sum(axis=1) <= 1)
+
+    # Constraint 3: Additional constraints for non-sequential tasks.
+    # Some worker must do both tasks; only workers skilled in both can satisfy this.
+    # does_both may only be true for a worker holding both tasks (linear bounds instead of a reified AND).
+    for a, b in [(lay_eva_index, operate_layup_index), (layup_quality_index, operate_bussing_index)]:
+        both = skill_np[:, a] & skill_np[:, b]
+        does_both = cp.boolvar(shape=(int(both.sum()),))
+        model += does_both <= assign[both, a]
+        model += does_both <= assign[both, b]
+        model += does_both.sum() >= 1
+
+    # Constraint 4: Symmetry breaking. Workers with identical skill rows are interchangeable,
+    # so their assignment rows are ordered lexicographically (only the skilled columns are variables).
+    _, group = np.unique(skill_np, axis=0, return_inverse=True)
+    group = group.ravel()
+    for g in np.unique(group[skill_np.any(axis=1)]):
+        members = np.flatnonzero(group == g)
+        for i, j in zip(members, members[1:]):
+            model += cp.LexLessEq(assign[j, skill_np[j]], assign[i, skill_np[i]])
+
+    # --- Worker "used" expressions for preference tracking ---
+    # A worker holds at most one regular task (Constraint 2) plus optionally the machine operation
+    # tasks, so "used" is a single linear reification over the worker's row; no extra variables.
+    worker_active = assign[:, mask_cols].sum(axis=1)
+    used = (worker_active + assign[:, operate_bussing_index] + assign[:, operate_layup_index]) >= 1
+
+    # Redundant cut for a stronger root bound: every worker holds at most one regular task (Constraint 2),
+    # so at least as many workers are used as there are regular task slots.
+    model += cp.sum(used) >= x[mask_cols].sum()
+
+    # --- Objective: Minimize total workers used.
+    # There is no preference term in this example, so no weighting is needed; a plain count keeps the
+    # objective's coefficients (and its domain in CP-SAT) small.
+    model.minimize(cp.sum(used))
+
+    return cp.SolverLookup.get(solver, model), assign
+
+if __name__ == "__main__":
+    # Optional backend name as the first argument (e.g. python MWE.py exact); OR-Tools is used when it is not installed.
+    solver_name = sys.argv[1] if len(sys.argv) > 1 else "ortools"
+    if solver_name not in cp.SolverLookup.solvernames():
+        print(f"Solver {solver_name} is not available, using ortools.")
+        solver_name = "ortools"
+    solver, assign = build_solver(seq_times, auto_times, skill_matrix, solver=solver_name)
+    # SOLVER_PARAMS are CP-SAT parameters; other backends run with their defaults.
+    if solver.solve(**(SOLVER_PARAMS if solver_name == "ortools" else {})):
+        print(assign.value())
+    else:
+        print("No solution found.")
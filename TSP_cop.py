@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 A CPMpy model and Tkinter UI for allocating workers to manual tasks,
-using integer (fraction) arithmetic and a soft preference objective.
+using integer (fixed-point) arithmetic and a soft preference objective.
 
 There are two groups of manual tasks:
   - Sequential tasks (which must run at a rate matching the bottleneck automated task).
@@ -17,11 +17,15 @@ and, secondarily, penalizes using non–preferred workers.
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import cpmpy as cp
 import numpy as np
-from fractions import Fraction
+from decimal import Decimal
+from functools import lru_cache
+import math
 import os
+import queue
 import sys
+import threading
+import time
 
 # === Data definitions ===
 
@@ -66,10 +70,21 @@ default_num_laminators = 1
 default_min_workers = [1, 1, 1, 1, 2, 1, 1, 1]
 default_max_workers = [999, 2, 999, 999, 2, 999, 999, 999]
 
+# CP-SAT search parameters (names as in OR-Tools' sat_parameters.proto). With several search workers CP-SAT
+# runs a parallel portfolio of strategies. The remaining values were picked with benchmark_params.py over the
+# default instance and harder ones (tight cycle time, preference objective). Core-based search (optimize_with_core)
+# is no faster on the easy instances and does not finish the tight one within 60 s, where the default takes about
+# 4 s; linearization levels 0 and 2 are equally fast without it, and level 1 is much slower on the tight instance.
+SOLVER_PARAMS = dict(num_search_workers=os.cpu_count() or 8, log_search_progress=False, optimize_with_core=False, linearization_level=0)
+
+# Default limit (in seconds) for one solve in the UI, over all lexicographic phases; it can be changed in the UI.
+DEFAULT_TIME_LIMIT = 60
+
 # Define a default number of available workers.
 # (Assume that each station is manned concurrently so the same worker cannot cover two stations.)
 worker_names = ["Arben", "Jamil", "Khairullah", "Fazli", "Mohammedsalih", "Singh", "Chance", "Tashrif", "Shahidullah", "Himmat", "Benda", "Shams", "Beata", "Roger", "Serhii", "Sabba", "Fahim", "Mahmoud", "Fanuel", "Tedros", "Latifi", "Oksana", "Romy", "Zakhel", "Abdul"]
 default_num_workers = len(worker_names)
+worker_names_arr = np.array(worker_names)
 
 skill_matrix = [
     # wash glass, lay EVA, lay-up quality check, manual soldering, closing, poetsen, connectoren, flashen, stringing, operate lay-up, operate bussing, operate laminator
@@ -100,11 +115,6 @@ skill_matrix = [
     [0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0], # Abdul
 ]
 
-# A large constant for lexicographic weighting.
-LARGE_WEIGHT = 1000
-MEDIUM_WEIGHT = 700
-SMALL_WEIGHT = 300
-
 # === CPMpy Model building function ===
 
 wash_glass_index = sequential_tasks.index("Wash Glass")
@@ -123,72 +133,256 @@ stringing_index = tasks_for_model.index("Stringing")
 
 task_pairs = [(wash_glass_index, lay_eva_index), (manual_soldering_index, closing_index), (closing_index, poetsen_index), (layup_quality_index, manual_soldering_index)]
 
-def solve_model(seq_times, auto_times, skill_matrix, preferred_list, num_laminators, min_workers, max_workers, occupation_treshold, efficiency, task_pairs=task_pairs):
+# Tasks that occupy a worker full-time, as a mask over tasks_for_model.
+full_time_mask = np.zeros(len(tasks_for_model), dtype=bool)
+full_time_mask[[stringing_index, operate_laminator_index]] = True
+
+# cpmpy loads OR-Tools, which takes about a second, so it is only imported when the first model is built
+# (see load_cpmpy) and the window appears immediately.
+cp = None
+
+def load_cpmpy():
+    """ Import cpmpy on first use and bind it to the module-level name cp. """
+    global cp
+    if cp is None:
+        import cpmpy
+        cp = cpmpy
+    return cp
+
+def time_scale(times):
+    """ Smallest power of 10 that turns all the given times into integers (e.g. [4.5, 3.25] -> 100). """
+    return 10 ** max(0, max(-Decimal(str(t)).as_tuple().exponent for t in times))
+
+def to_fixed_point(t, scale):
     """
-    Build and solve the model.
-    
-    Parameters:
-      seq_times: list of floats for each sequential task.
-      auto_times: list of floats for each automated task.
-      skill_matrix: 2D list (num_workers x total_tasks) of booleans.
-                    The columns correspond to tasks_for_model (sequential tasks first, then non-sequential tasks).
-      preferred_list: list of booleans (length=num_workers) indicating preferred workers.
-      
+    Integer value of a time entry in units of 1/scale minutes (e.g. 4.5 -> 45 for scale 10).
+    A sequence of times is converted in one NumPy pass and returned as an int64 array.
+    """
+    if np.ndim(t) == 0:
+        return round(t * scale)
+    return np.rint(np.asarray(t, dtype=np.float64) * scale).astype(np.int64)
+
+def build_efficiency_multiplier(num_workers, efficiency):
+    """
+    Precompute the per-worker efficiency multipliers (in percent) for each sequential task.
+
+    Entry [i, j] is floor(100 * (efficiency[j]/100)**i): the individual efficiency of each worker
+    when i + 1 workers share task j. Returns an int64 array of shape (num_workers, len(efficiency)).
+    """
+    eff = np.asarray(efficiency, dtype=np.float64) / 100
+    return np.floor(100 * eff[None, :] ** np.arange(num_workers)[:, None]).astype(np.int64)
+
+def build_penalty_bounds(seq_int, T_int, seq_x_bounds, efficiency_multiplier, cap=1000):
+    """
+    Upper bounds of the Constraint 10 penalties, computed for all sequential tasks at once.
+
+    The work required for task m is ceil(10000 * seq_int[m] / (T_int * efficiency)), which is largest for
+    the least efficient worker count within seq_x_bounds[m] = (lb, ub). Returns an int64 array, capped at cap.
+    """
+    lb, ub = np.asarray(seq_x_bounds, dtype=np.int64).T
+    counts = np.arange(1, efficiency_multiplier.shape[0] + 1)[:, None]
+    allowed = (counts >= lb) & (counts <= ub)
+    least_efficient = np.where(allowed, efficiency_multiplier, np.iinfo(np.int64).max).min(axis=0)
+    num = 10000 * np.asarray(seq_int, dtype=np.int64)
+    den = T_int * least_efficient
+    return np.where(den > 0, np.minimum(cap, -(-num // np.maximum(den, 1))), cap)
+
+def greedy_assignment_hint(seq_times, T, skill_matrix, preferred_list, num_laminators, min_workers, max_workers):
+    """
+    Build a quick greedy allocation to warm-start the solver.
+
+    Sequential tasks are filled first, tightest (largest min_workers, then fewest skilled workers) first,
+    with ceil(base_time / T) workers rounded up to a multiple of min_workers. Preferred workers are picked
+    before the others. The hint does not have to be feasible; it only guides the solver's first branches.
+
     Returns:
-      A dictionary with solution details or None if no solution is found.
+      An int array (num_workers x total_tasks) with 1 where the greedy allocation assigns a worker.
+    """
+    skill_np = np.array(skill_matrix, dtype=bool)
+    num_workers, total_tasks = skill_np.shape
+    n_seq = len(seq_times)
+    scale = time_scale([*seq_times, T])
+    seq_int, T_int = to_fixed_point(seq_times, scale), to_fixed_point(T, scale)
+    hint = np.zeros((num_workers, total_tasks), dtype=int)
+    taken = np.zeros(num_workers, dtype=bool)
+    # Preferred workers first, then by worker index.
+    worker_order = np.argsort(~np.asarray(preferred_list, dtype=bool), kind="stable")
+
+    def pick(m, count):
+        chosen = worker_order[skill_np[worker_order, m] & ~taken[worker_order]][:count]
+        hint[chosen, m] = 1
+        taken[chosen] = True
+
+    # Workers needed per sequential task, computed for all tasks at once.
+    min_w = np.asarray(min_workers)
+    need = np.maximum(min_w, -(-seq_int // T_int))
+    need = np.minimum(-(-need // min_w) * min_w, max_workers)
+    # Tightest tasks first: largest min_workers, then fewest skilled workers.
+    for m in np.lexsort((skill_np[:, :n_seq].sum(axis=0), -min_w)):
+        pick(m, need[m])
+
+    pick(stringing_index, 1)
+    pick(operate_laminator_index, num_laminators)
+    # The machine operators are taken from the workers on the paired sequential task when possible.
+    for seq_m, op_m in [(lay_eva_index, operate_layup_index), (layup_quality_index, operate_bussing_index)]:
+        candidates = np.flatnonzero(hint[:, seq_m] & skill_np[:, op_m])
+        if candidates.size:
+            hint[candidates[0], op_m] = 1
+        else:
+            pick(op_m, 1)
+    return hint
+
+def check_staffing(skill_matrix, min_workers, num_laminators):
     """
+    Quick necessary conditions on the skill matrix, checked before building the model.
+
+    Every task needs enough skilled workers (min_workers for sequential tasks, num_laminators for the
+    laminator and one for the other non-sequential tasks), and Constraint 6 needs a worker skilled in both
+    tasks of each machine pair.
+
+    Returns:
+      A message describing the first violated condition, or None if none is violated.
+    """
+    skill_np = np.array(skill_matrix, dtype=bool)
+    skilled_count = skill_np.sum(axis=0)
+    required = np.ones(len(tasks_for_model), dtype=int)
+    required[:len(min_workers)] = min_workers
+    required[operate_laminator_index] = num_laminators
+    understaffed = np.flatnonzero(skilled_count < required)
+    if understaffed.size:
+        m = understaffed[0]
+        return f"{tasks_for_model[m]} needs {required[m]} skilled worker(s), but only {skilled_count[m]} are available."
+    for seq_m, op_m in [(lay_eva_index, operate_layup_index), (layup_quality_index, operate_bussing_index)]:
+        if not np.any(skill_np[:, seq_m] & skill_np[:, op_m]):
+            return f"No worker is skilled in both {tasks_for_model[seq_m]} and {tasks_for_model[op_m]}."
+    return None
+
+def add_symmetry_breaking(model, assign, used, skill_matrix):
+    """
+    Workers with the same skill row are interchangeable as far as the model is concerned, so any solution can be
+    permuted among them. Within each such group, order the workers so that earlier workers are used
+    first and have lexicographically larger assignment rows (over the skilled columns, the only variables).
+    Workers without any skill are never used and are left out.
+
+    The preferences are not part of the cached model, so the ordering is posted for every pair i < j of workers
+    with the same skill row, guarded by a literal. Only pairs that also share the preference flag are
+    interchangeable in a given solve; symmetry_assumptions selects their literals as assumptions.
+    Returns a dict {(i, j): literal}.
+    """
+    skill_np = np.array(skill_matrix, dtype=bool)
+    # Each skill row is packed into bytes (8 tasks per byte) and viewed as one opaque key, so rows are grouped
+    # exactly, for any number of tasks, with a 1-D unique.
+    packed = np.ascontiguousarray(np.packbits(skill_np, axis=1))
+    _, group = np.unique(packed.view(np.dtype((np.void, packed.shape[1]))).ravel(), return_inverse=True)
+    symmetry = {}
+    for g in np.unique(group[skill_np.any(axis=1)]):
+        members = np.flatnonzero(group == g)
+        for a, i in enumerate(members):
+            for j in members[a + 1:]:
+                symmetry[i, j] = cp.boolvar()
+                model += symmetry[i, j].implies(used[i] >= used[j])
+                model += symmetry[i, j].implies(cp.LexLessEq(assign[j, skill_np[j]], assign[i, skill_np[i]]))
+    return symmetry
+
+def symmetry_assumptions(symmetry, preferred_list):
+    """
+    Select the symmetry breaking literals that hold for the given preferences: those chaining consecutive
+    workers with the same skill row and the same preference flag.
+    """
+    pref = np.asarray(preferred_list, dtype=bool)
+    chains = {}
+    for i, j in symmetry:
+        chains.setdefault(i, set()).add(j)
+        chains.setdefault(j, set()).add(i)
+    assumptions = []
+    for (i, j), literal in symmetry.items():
+        if pref[i] == pref[j] and not any(i < k < j and pref[k] == pref[i] for k in chains[i]):
+            assumptions.append(literal)
+    return assumptions
+
+@lru_cache(maxsize=8)
+def build_solver(seq_times, auto_times, skill_matrix, num_laminators, min_workers, max_workers, occupation_treshold, efficiency, task_pairs):
+    """
+    Build the model and load it into an OR-Tools solver.
+
+    All arguments must be hashable (tuples instead of lists): the result is memoized, so solving
+    the same inputs again (e.g. repeated clicks in the UI) reuses the already transformed solver
+    instead of rebuilding and re-encoding the whole model. Most of the build time is spent in CPMpy's
+    transformation into CP-SAT, not in the Python code below, so caching the result is what pays off.
+
+    Returns:
+      A tuple (solver, variables, objectives) where variables is a dict of the decision variables (and the
+      symmetry breaking literals) and objectives lists the objective variables from highest to lowest priority.
+    """
+    load_cpmpy()
     n_seq = len(seq_times)                   # number of sequential tasks
     total_tasks = len(tasks_for_model)        # total tasks (sequential + non-sequential)
     num_workers = len(skill_matrix)
     
     # Compute the bottleneck cycle time T from the automated tasks.
-    # Use Fraction to represent numbers as rational numbers.
-    T_frac = max([Fraction(str(t)) for t in auto_times])
+    # Times are converted to fixed-point integers, so the model only involves integer constants.
+    # One common scale (a power of 10) is picked for all times that enter the model, so that no entry is rounded.
+    # Only the slowest automated task does, so the others cannot inflate the scale (and the coefficients).
+    T = max(auto_times)
+    scale = time_scale([*seq_times, T])
+    T_int = to_fixed_point(T, scale)
+    seq_int = to_fixed_point(seq_times, scale)
     
     # Decision variables:
     # For each task m in tasks_for_model, let x[m] be the number of workers assigned.
     # For sequential tasks, x[m] must be chosen to satisfy the effective time constraint.
     # For non-sequential tasks (e.g. Stringing) we force x[m] == 1.
-    x = cp.intvar(1, num_workers, shape=total_tasks)
+    # The worker bounds (Constraints 2, 4 and 5) are fixed at model-build time, so they are applied
+    # directly as the variable domains instead of being posted as constraints. No task can have more workers
+    # than there are workers skilled for it, which tightens the upper bound further, and the upper bound is
+    # rounded down to a multiple of the minimum (Constraint 2).
+    skill_np = np.array(skill_matrix, dtype=bool)
+    skilled_count = skill_np.sum(axis=0)
+    skilled_count_per_worker = skill_np.sum(axis=1)
+    x_bounds = [(min_workers[m], int(min(max_workers[m], skilled_count[m])) // min_workers[m] * min_workers[m]) for m in range(n_seq)]
+    x_bounds += [(num_laminators, num_laminators) if m == operate_laminator_index else (1, 1) for m in range(n_seq, total_tasks)]
+    x = cp.cpm_array([cp.intvar(lb, ub) for lb, ub in x_bounds])
 
     # For each worker i and task m, assign[i, m] is binary: 1 if worker i is assigned to task m.
-    assign = cp.boolvar(shape=(num_workers, total_tasks))
-
-    # Penalty variables for violating Constraint 10
-    penalty = cp.intvar(0, 1000, shape=n_seq)
+    # Constraint 3: A worker may only be assigned to a task if they are skilled. Unskilled cells are the
+    # constant False instead of a variable, so they never reach the solver.
+    assign = np.full((num_workers, total_tasks), cp.BoolVal(False), dtype=object)
+    assign[skill_np] = cp.boolvar(shape=int(skill_np.sum()))
+    assign = cp.cpm_array(assign)
+
+    # Penalty variables for violating Constraint 10.
+    # A penalty never exceeds the work required for its task, which is largest for the least efficient
+    # allowed number of workers, so that value (capped at 1000) bounds its domain.
+    efficiency_multiplier = build_efficiency_multiplier(num_workers, efficiency)
+    penalty_ub = build_penalty_bounds(seq_int, T_int, x_bounds[:n_seq], efficiency_multiplier)
+    penalty = cp.cpm_array([cp.intvar(0, int(penalty_ub[m])) for m in range(n_seq)])
 
     model = cp.Model()
 
     # Constraint 1: For each task, the number of assigned workers equals x[m].
-    for m in range(total_tasks):
-        model += cp.sum([assign[i, m] for i in range(num_workers)]) == x[m]
+    # Posted as one array constraint; the constant False cells drop out of the column sums.
+    model += assign.sum(axis=0) == x
 
-    # Constraint 2: For each sequential task, at least the minimum required workers are assigned.
+    # Constraint 2: For each sequential task, the number of workers is a multiple of the minimum
+    # (the minimum and maximum themselves are the domain of x[m]). Every count is a multiple of 1, and a
+    # task whose domain is a single value needs no constraint either.
     for m in range(n_seq):
-        model += x[m] >= min_workers[m]
-        model += x[m] % min_workers[m] == 0
-        model += x[m] <= max_workers[m]
-
-    # Constraint 3: A worker may only be assigned to a task if they are skilled.
-    for i in range(num_workers):
-        for m in range(total_tasks):
-            if not skill_matrix[i][m]:
-                model += assign[i, m] == 0
-
-    # Constraint 4: Ensure that each laminator has exactly one worker assigned.
-    model += x[operate_laminator_index] == num_laminators
-    model += x[stringing_index] == 1
-
-    # Constraint 5: For non-sequential tasks, force x[m] == 1.
-    for m in range(n_seq, total_tasks-1):
-        model += x[m] == 1
-
-    # Constraint 6: At least one worker that is allocated to "Lay-up Quality Check" must be allocated to "Operate Lay-up Machine".
-    # Same for "Lay EVA" and "Operate Bussing Machine".
-    model += cp.sum([assign[i, lay_eva_index] & assign[i, operate_layup_index] for i in range(num_workers)]) >= 1
-    model += cp.sum([assign[i, layup_quality_index] & assign[i, operate_bussing_index] for i in range(num_workers)]) >= 1
-    for i in range(num_workers):
-        model += cp.sum([assign[i, j] for j in range(n_seq, total_tasks)]) <= 1
+        if min_workers[m] > 1 and x_bounds[m][0] < x_bounds[m][1]:
+            model += x[m] % min_workers[m] == 0
+
+    # Constraint 6: At least one worker that is allocated to "Lay EVA" must be allocated to "Operate Lay-up Machine".
+    # Same for "Lay-up Quality Check" and "Operate Bussing Machine".
+    # Only workers skilled in both tasks can do both. For each of them, does_both may only be true if the worker
+    # holds both tasks (two linear bounds, no reified AND), and at least one of them must be true.
+    for a, b in [(lay_eva_index, operate_layup_index), (layup_quality_index, operate_bussing_index)]:
+        both = skill_np[:, a] & skill_np[:, b]
+        does_both = cp.boolvar(shape=(int(both.sum()),))
+        model += does_both <= assign[both, a]
+        model += does_both <= assign[both, b]
+        model += does_both.sum() >= 1
+    # Each worker holds at most one non-sequential task. A sum of Booleans <= 1 is recognised by CP-SAT as a native
+    # at-most-one constraint, which propagates as tightly as a cardinality global over a task-index variable.
+    model += assign[:, n_seq:].sum(axis=1) <= 1
 
     # =============== OCCUPATION OPTIMIZATION ==============
     # === Manual capacity constraints and "sharing" rule ===
@@ -204,107 +398,248 @@ def solve_model(seq_times, auto_times, skill_matrix, preferred_list, num_laminat
     # then we need: sum_i frac[i, m] + penalty[m] >= required_fraction.
     
     # Introduce integer decision variables for the fraction of time each worker spends on each sequential task.
-    occupation = cp.intvar(0, 100, shape=(num_workers, total_tasks))
-
-    efficiency_multiplier = np.zeros((num_workers, n_seq), dtype=int)
-    for i in range(num_workers):
-        for j in range(n_seq):
-            efficiency_multiplier[i, j] = int(100 * (efficiency[j]/100)**(i) // 1)
+    # Like assign, occupation is only a variable where the worker is skilled for a sequential task. Stringing and
+    # operating a laminator are full-time, so their occupation is 100 * assign (Constraint 14) without a variable;
+    # it is the constant 0 elsewhere, including the machine operation tasks, which take no manual time.
+    has_occupation = skill_np.copy()
+    has_occupation[:, n_seq:] = False
+    occupation = np.where(skill_np & full_time_mask, 100 * assign, 0)
+    occupation[has_occupation] = cp.intvar(0, 100, shape=int(has_occupation.sum()))
+    occupation = cp.cpm_array(occupation)
 
     # Constraint 7: Each worker can be assigned to at most one task, except for paired tasks.
     # Non-paired tasks do not share time and have equal work distribution.
     # Paired tasks allow workers to split time if they do not exceed a certain threshold on either task. 
     split_work = cp.boolvar(shape=(num_workers, len(task_pairs)))
-    for i in range(num_workers):
-        for j, (a, b) in enumerate(task_pairs):
-            model += (split_work[i, j]).implies(assign[i, a] + assign[i, b] == 2)
-    for i in range(num_workers):
-        model += (cp.sum(split_work[i, :]) >= 1).implies(cp.sum(assign[i, range(n_seq)]) == 2)
-        model += (cp.sum(split_work[i, :]) == 0).implies(cp.sum(assign[i, range(n_seq)]) <= 1)
+    for j, (a, b) in enumerate(task_pairs):
+        model += split_work[:, j].implies(assign[:, a] + assign[:, b] == 2)
+    model += (split_work.sum(axis=1) >= 1).implies(assign[:, :n_seq].sum(axis=1) == 2)
+    model += (split_work.sum(axis=1) == 0).implies(assign[:, :n_seq].sum(axis=1) <= 1)
 
     # Constraint 8 & 9: If a worker i is not assigned to task m then his oocupation[i, m] == 0. 
     # If a worker is assigned to a non-splittable task, Then the work is distributed evenly between the workers assigned to that task. 
-    # occupation[i, m] == seq_times[m] // (x[m] * T_frac).
-    seq_times_frac = [Fraction(str(t)) for t in seq_times]
-    for i in range(num_workers):
-        for m in range(n_seq):
-            model += occupation[i, m] <= 100 * assign[i, m]
+    # occupation[i, m] == seq_times[m] // (x[m] * T).
+    # has_occupation holds exactly the skilled sequential cells, so both constraints are posted over that mask.
+    model += occupation[has_occupation] <= 100 * assign[has_occupation]
 
     # Constraint 10: For each sequential task, the sum of the fractions (i.e. effective worker–capacity) must cover the work.
-    for m in range(n_seq):
-        efficiency_multiplier_m = efficiency_multiplier[:, m].T
-        num = 10000 * seq_times_frac[m].numerator * T_frac.denominator
-        den = T_frac.numerator * seq_times_frac[m].denominator * cp.Element(efficiency_multiplier_m, x[m]-1)
-        required = (num + den - 1) // den
-        # We allow a penalty if the capacity is a bit short; the objective will try to drive these penalties to zero.
-        model += cp.sum(occupation[i, m] for i in range(num_workers)) + penalty[m] == required
+    # All tasks are posted into the same model. The efficiency multiplier for x[m] workers is selected
+    # through a one-hot encoding of x[m] (efficiency_selector[m, k] == 1 iff x[m] == k + 1), so the
+    # lookup is a plain linear sum over Booleans instead of an Element/Table propagator.
+    # Like assign, the selector only holds variables for the worker counts x[m] can take (its domain and the
+    # multiples of min_workers[m]); the other entries are the constant 0 and never reach the solver.
+    efficiency_columns = np.ascontiguousarray(efficiency_multiplier.T)
+    worker_counts = np.arange(1, num_workers + 1)
+    lb, ub = np.array(x_bounds[:n_seq]).T
+    selectable = ((worker_counts >= lb[:, None]) & (worker_counts <= ub[:, None])
+                  & (worker_counts % np.array(min_workers)[:, None] == 0))
+    efficiency_selector = np.zeros((n_seq, num_workers), dtype=object)
+    efficiency_selector[selectable] = cp.boolvar(shape=int(selectable.sum()))
+    efficiency_selector = cp.cpm_array(efficiency_selector)
+    efficiency_lookup = cp.intvar(0, int(efficiency_multiplier.max()), shape=n_seq)
+    # required[m] = ceil(num / den) is encoded with multiplications only (den * q >= num > den * (q - 1)),
+    # which avoids the decomposition of an integer division on a variable denominator.
+    required = cp.intvar(0, 100 * num_workers + 1000, shape=n_seq)
+    model += efficiency_selector.sum(axis=1) == 1
+    model += (efficiency_selector * worker_counts).sum(axis=1) == x[:n_seq]
+    model += (efficiency_selector * efficiency_columns).sum(axis=1) == efficiency_lookup
+    # We allow a penalty if the capacity is a bit short; the objective will try to drive these penalties to zero.
+    model += occupation[:, :n_seq].sum(axis=0) + penalty == required
+    num = 10000 * seq_int
+    den = T_int * efficiency_lookup
+    model += den * required >= num
+    model += den * (required - 1) < num
 
     # Constraint 11: Each worker’s total manual time cannot exceed 100% of his occupation.
-    for i in range(num_workers):
-        model += cp.sum(occupation[i, m] for m in range(total_tasks)) <= 100
+    model += occupation.sum(axis=1) <= 100
 
     # Constraint 12: For splittable tasks, each pair (a, b) in task_pairs and each worker, the sum of the fractions
     # that worker devotes to tasks a and b cannot exceed 1.
+    # Note: a and b are assumed to be indices in the sequential (manual) tasks [0, n_seq-1].
     for (a, b) in task_pairs:
-        for i in range(num_workers):
-            # Note: a and b are assumed to be indices in the sequential (manual) tasks [0, n_seq-1].
-            model += occupation[i, a] + occupation[i, b] <= 100
+        model += occupation[:, a] + occupation[:, b] <= 100
 
     # Constraint 13: A worker can only split his occupation between multiple splittable tasks if he doesn't exceed the occupation treshold in both tasks. 
     # (e.g. It is trivial for a worker to devote 99% of his occupation to one task and 1% to another task)
+    # Since occupation[i, t] is 0 whenever assign[i, t] is 0 (Constraint 8), the product assign * occupation
+    # equals occupation and the bound can be posted on occupation directly.
+    splits = assign.sum(axis=1) > 1
     for i in range(num_workers):
-        model += (cp.sum(assign[i, :]) > 1).implies(cp.all([assign[i, t]*occupation[i, t] <= occupation_treshold for t in range(n_seq)]))
+        model += splits[i].implies(cp.all(occupation[i, :n_seq] <= occupation_treshold))
 
     # Constraint 14: If a worker is assigned to a task, his occupation for that task must be greater then 0.
-    for i in range(num_workers):
-        for j in range(n_seq):
-            model += (assign[i,j]).implies(occupation[i, j] != 0)
-            model += (assign[i,stringing_index]).implies(occupation[i, stringing_index] == 100)
-            model += (assign[i,operate_laminator_index]).implies(occupation[i, operate_laminator_index] == 100)
-
-    model += [occupation[i, operate_bussing_index] == 0 for i in range(num_workers)]
-    model += [occupation[i, operate_layup_index] == 0 for i in range(num_workers)]
-
-    # Create reference occupation variables for each task
-    reference_occupation = cp.intvar(0, 100, shape=n_seq)
+    model += assign[has_occupation].implies(occupation[has_occupation] != 0)
 
-    # Constraint: If the minimum number of workers for a task is greater than 1, then the workers assigned should do the same amount of work
+    # Constraint: If the minimum number of workers for a task is greater than 1, then the workers assigned should do the same amount of work.
+    # min_workers is known when the model is built, so the condition is checked here and each assigned worker's
+    # occupation is tied to one shared reference value per task with a half-reified equality.
     for m in range(n_seq):
-        min_workers_greater_than_one = cp.boolvar()
-        model += (min_workers_greater_than_one == (min_workers[m] > 1))
-        for i in range(num_workers):
-            model += (min_workers_greater_than_one & assign[i, m]).implies(occupation[i, m] == reference_occupation[m])
+        if min_workers[m] > 1:
+            reference_occupation = cp.intvar(0, 100)
+            skilled = skill_np[:, m]
+            model += assign[skilled, m].implies(occupation[skilled, m] == reference_occupation)
 
     # --- Introduce worker "used" variables for preference tracking ---
+    # A worker is used as soon as they hold any task. This is channelled with a linear bound (the number of
+    # tasks a worker is skilled for caps their row sum) instead of a reified implication; the objective
+    # drives used down, so the bound is tight. (Per-cell bounds used[i] >= assign[i, m] give a tighter LP relaxation,
+    # but SOLVER_PARAMS runs without linearization and they measured slower on the default instances.)
+    # used cannot be replaced by the row sums of assign: a worker may hold several tasks (split tasks, machine
+    # operation) but counts once. Aliasing used[i] to the assign literal of single-skill workers is valid, but
+    # it also measured slower, so every worker keeps their own used variable.
     used = cp.boolvar(shape=num_workers)
-    for i in range(num_workers):
-        model += (cp.sum([assign[i, m] for m in range(total_tasks)]) >= 1).implies(used[i])
-
-    # --- Objective: We want to (primarily) minimize the total number of workers used,
-    # (secondarily) avoid using non-preferred workers, and (tertiary) minimize any penalties.
-    p = [1 if preferred_list[i] else 0 for i in range(num_workers)]
-    obj = (LARGE_WEIGHT  * cp.sum(used[i] for i in range(num_workers)) +
-           MEDIUM_WEIGHT * cp.sum(penalty[m] for m in range(n_seq)) + 
-           SMALL_WEIGHT  * cp.sum(p[i] * used[i] for i in range(num_workers)))
-
-
-    model.minimize(obj)
-
-    if model.solve():        
-        sol = {
-            "x": x.value(),
-            "assignment": assign.value(),
-            "used": used.value(),
-            "occupation": occupation.value(),
-            "total_workers": sum(used.value()),
-            "T": T_frac
-        }
-        return sol
-    else:
+    model += assign.sum(axis=1) <= skilled_count_per_worker * used
+
+    # Redundant cuts for a stronger root bound: the x[m] workers of a task are used workers skilled for it,
+    # every non-sequential slot needs its own worker (assign[:, n_seq:].sum(axis=1) <= 1 allows at most one per worker),
+    # and the total occupation fits in 100% per used worker.
+    # (sum(used) == sum(x) does not hold: one worker may fill several slots, e.g. split tasks or a machine next to
+    # a sequential task, so the slots only bound the used workers per task and for the non-sequential tasks.)
+    model += cp.cpm_array(np.where(skill_np, used[:, None], 0)).sum(axis=0) >= x
+    model += used.sum() >= x[n_seq:].sum()
+    model += occupation.sum() <= 100 * used.sum()
+
+    # --- Objectives, in priority order: We want to (primarily) minimize the total number of workers used,
+    # and (secondarily) minimize any penalties. solve_model adds the preference objective, so that the model
+    # does not depend on the preferences.
+    # Each objective is an integer variable, so that solve_model can fix its optimum by narrowing the domain
+    # instead of adding constraints to the cached solver.
+    total_used = cp.intvar(0, num_workers)
+    total_penalty = cp.intvar(0, int(penalty_ub.sum()))
+    model += total_used == used.sum()
+    model += total_penalty == penalty.sum()
+    objectives = [total_used, total_penalty]
+
+    symmetry = add_symmetry_breaking(model, assign, used, skill_matrix)
+
+    variables = {"x": x, "assign": assign, "used": used, "occupation": occupation, "symmetry": symmetry}
+    return cp.SolverLookup.get("ortools", model), variables, objectives
+
+# Serializes access to the build_solver cache: the UI prebuilds the default solver in a background thread,
+# and a solve started meanwhile must wait for it instead of building the same model a second time.
+_build_lock = threading.Lock()
+
+def cached_solver(seq_times, auto_times, skill_matrix, num_laminators, min_workers, max_workers, occupation_treshold, efficiency, task_pairs=task_pairs):
+    """ build_solver for list/array arguments: converts them to the hashable cache key and builds under _build_lock. """
+    with _build_lock:
+        return build_solver(tuple(seq_times), tuple(auto_times), tuple(tuple(row) for row in skill_matrix),
+                            num_laminators, tuple(min_workers), tuple(max_workers),
+                            occupation_treshold, tuple(efficiency), tuple(task_pairs))
+
+def solve_model(seq_times, auto_times, skill_matrix, preferred_list, num_laminators, min_workers, max_workers, occupation_treshold, efficiency, task_pairs=task_pairs,
+                cpsat_params=None, hint=None, time_limit=None):
+    """
+    Build and solve the model.
+    
+    Parameters:
+      seq_times: list of floats for each sequential task.
+      auto_times: list of floats for each automated task.
+      skill_matrix: 2D list (num_workers x total_tasks) of booleans.
+                    The columns correspond to tasks_for_model (sequential tasks first, then non-sequential tasks).
+      preferred_list: list of booleans (length=num_workers) indicating preferred workers.
+      cpsat_params: optional dict of CP-SAT parameters overriding SOLVER_PARAMS (e.g. num_search_workers).
+      hint: optional assignment (num_workers x total_tasks) of a previous solve, used to warm-start the
+            solver instead of the greedy allocation.
+      time_limit: optional limit in seconds for the whole solve (all lexicographic phases together).
+      
+    Returns:
+      A dictionary with solution details or None if no solution exists. sol["optimal"] is False if the time
+      limit stopped the search before the solution was proven optimal.
+    Raises:
+      TimeoutError if the time limit is reached before any solution is found.
+    """
+    load_cpmpy()
+    # Contradictory worker bounds cannot be represented as variable domains; there is no solution.
+    # A minimum below 1 is invalid as well (the counts are multiples of the minimum).
+    num_workers = len(skill_matrix)
+    if any(not 1 <= lo <= min(hi, num_workers) for lo, hi in zip(min_workers, max_workers)) or not 1 <= num_laminators <= num_workers:
         return None
+    if check_staffing(skill_matrix, min_workers, num_laminators) is not None:
+        return None
+
+    # The preferences only enter the last objective and the choice of symmetry breaking literals, so toggling
+    # them reuses the cached solver.
+    solver, variables, objectives = cached_solver(seq_times, auto_times, skill_matrix, num_laminators, min_workers, max_workers,
+                                                  occupation_treshold, efficiency, task_pairs)
+    x, assign, used, occupation = variables["x"], variables["assign"], variables["used"], variables["occupation"]
+    # Tertiary objective: avoid using non-preferred workers. It only sums the used variables of those workers
+    # (no zero-weighted terms), and there is nothing to optimize when every worker is preferred.
+    non_preferred = ~np.asarray(preferred_list, dtype=bool)
+    if non_preferred.any():
+        objectives = [*objectives, used[non_preferred].sum()]
+    T = max(auto_times)
+
+    # Warm-start the solver with the previous solution if there is one (re-solves after a small change of the
+    # inputs usually stay close to it), otherwise with a greedy allocation.
+    if hint is not None and np.shape(hint) == np.shape(skill_matrix):
+        assign_hint = np.asarray(hint, dtype=int)
+    else:
+        assign_hint = greedy_assignment_hint(seq_times, T, skill_matrix, preferred_list, num_laminators, min_workers, max_workers)
+
+    # Lexicographic optimization: solve one objective at a time and fix its optimum before moving on to
+    # the next. The optimum is fixed by narrowing the domain of the objective variable in the CP-SAT model
+    # (no literals or constraints are added), and the original domains are restored afterwards, so the
+    # cached solver is left as it was for later calls. Each phase is hinted with the previous solution.
+    # Only the skilled cells of assign are variables, so only those are hinted; x and used follow from the
+    # hinted assignment (column counts and non-empty rows), which gives CP-SAT a complete starting point.
+    skill_np = np.array(skill_matrix, dtype=bool)
+    solver_params = dict(SOLVER_PARAMS, **(cpsat_params or {}))
+    assumptions = symmetry_assumptions(variables["symmetry"], preferred_list)
+    # The time limit is shared by the phases: each phase gets what is left of it. When it runs out, the
+    # solution of the last completed phase is returned and marked as not proven optimal.
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    sol = None
+    optimal = True
+    fixed_domains = []  # (domain in the CP-SAT proto, original bounds)
+    try:
+        for objective in objectives:
+            remaining = None if deadline is None else deadline - time.perf_counter()
+            if remaining is not None and remaining <= 0 and sol is not None:
+                optimal = False
+                break
+            solver.minimize(objective)
+            solver.solution_hint([*assign[skill_np], *x, *used],
+                                 [*assign_hint[skill_np].tolist(), *assign_hint.sum(axis=0).tolist(), *assign_hint.any(axis=1).astype(int).tolist()])
+            found = solver.solve(assumptions=assumptions, time_limit=None if remaining is None else max(remaining, 0.01), **solver_params)
+            status = solver.status().exitstatus.name
+            if not found:
+                if status == "UNSATISFIABLE" and sol is None:
+                    return None
+                if sol is None:
+                    raise TimeoutError(f"No solution was found within the time limit of {time_limit:g} s.")
+                optimal = False
+                break
+            optimal = optimal and status == "OPTIMAL"
+            used_value = np.asarray(used.value(), dtype=np.uint8)
+            sol = {
+                "x": x.value(),
+                "assignment": np.asarray(assign.value(), dtype=np.uint8),
+                "used": used_value,
+                "occupation": occupation.value(),
+                "total_workers": int(used_value.sum()),
+                "T": T
+            }
+            # The last objective (the preference sum) is never fixed, so it does not need to be a variable.
+            if objective is not objectives[-1]:
+                domain = solver.ort_model.Proto().variables[solver.solver_var(objective).Index()].domain
+                fixed_domains.append((domain, (domain[0], domain[1])))
+                domain[0] = domain[1] = int(objective.value())
+            assign_hint = sol["assignment"].astype(int)
+    finally:
+        for domain, (lb, ub) in fixed_domains:
+            domain[0], domain[1] = lb, ub
+
+    sol["optimal"] = optimal
+    return sol
 
 # === Tkinter UI ===
 
+# Interval (in ms) at which the Tk thread checks whether a background solve has finished.
+RESULT_POLL_MS = 50
+
+# Reads a whole array of Tk variables (e.g. the checkbox states) into an array of their values.
+read_vars = np.frompyfunc(lambda var: var.get(), 1, 1)
+
 class ProductionLineUI(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -333,12 +668,8 @@ class ProductionLineUI(tk.Tk):
         self.h_scrollbar = ttk.Scrollbar(self, orient="horizontal", command=self.canvas.xview)
         self.scrollable_frame = ttk.Frame(self.canvas)
 
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(
-                scrollregion=self.canvas.bbox("all")
-            )
-        )
+        self._scrollregion = None
+        self.scrollable_frame.bind("<Configure>", self._update_scrollregion)
 
         self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
         self.canvas.configure(yscrollcommand=self.v_scrollbar.set, xscrollcommand=self.h_scrollbar.set)
@@ -347,7 +678,11 @@ class ProductionLineUI(tk.Tk):
         self.v_scrollbar.pack(side="right", fill="y")
         # self.h_scrollbar.pack(side="bottom", fill="x")
 
-        # Bind mouse wheel events to the canvas
+        # Bind mouse wheel events to the canvas.
+        # Wheel deltas are accumulated as (x, y) and applied once the event queue is idle, so a fast
+        # scroll results in one scroll (and redraw) instead of one per wheel notch.
+        self._pending_wheel = [0, 0]
+        self._wheel_flush_scheduled = False
         self.canvas.bind_all("<MouseWheel>", self._on_mouse_wheel)
         self.canvas.bind_all("<Shift-MouseWheel>", self._on_shift_mouse_wheel)
 
@@ -426,10 +761,16 @@ class ProductionLineUI(tk.Tk):
             ttk.Label(skill_frame, text=worker_names[i]).grid(row=i+1, column=0, padx=3, pady=3, sticky="w")
             for m in range(len(tasks_for_model)):
                 var = tk.IntVar(value=skill_matrix[i][m])
+                var.trace_add("write", self._mark_skill_dirty)
                 cb = ttk.Checkbutton(skill_frame, variable=var)
                 cb.grid(row=i+1, column=m+1, padx=3, pady=3)
                 row_vars.append(var)
             self.skill_vars.append(row_vars)
+        # The checkbox states are read into this array on every solve.
+        # The checkboxes are only read again after one of them changed (tracked by _mark_skill_dirty).
+        self._skill_var_array = np.array(self.skill_vars, dtype=object)
+        self._skill_np = np.zeros((default_num_workers, len(tasks_for_model)), dtype=bool)
+        self._skill_dirty = True
 
         # --- Worker Preferences ---
         pref_frame = ttk.LabelFrame(self.left_frame, text="Worker Preferences")
@@ -444,41 +785,117 @@ class ProductionLineUI(tk.Tk):
             cb = ttk.Checkbutton(pref_frame, text=worker_names[i], variable=var)
             cb.grid(row=row, column=col, padx=5, pady=5, sticky="w")
             self.pref_vars.append(var)
+        self._pref_var_array = np.array(self.pref_vars, dtype=object)
+        self._pref_np = np.zeros(default_num_workers, dtype=bool)
+
+        # --- Solver Settings ---
+        solver_frame = ttk.LabelFrame(self.left_frame, text="Solver Settings")
+        solver_frame.grid(row=4, column=0, padx=10, pady=5, sticky="ew")
+        ttk.Label(solver_frame, text="Search Workers:").grid(row=0, column=0, sticky="w")
+        # Limited to the number of CPUs; lower it to keep a laptop responsive during a solve.
+        self.search_workers_entry = ttk.Spinbox(solver_frame, from_=1, to=os.cpu_count() or 8, width=6)
+        self.search_workers_entry.grid(row=0, column=1, padx=5, pady=2)
+        self.search_workers_entry.set(SOLVER_PARAMS["num_search_workers"])
+        ttk.Label(solver_frame, text="Time Limit (s):").grid(row=1, column=0, sticky="w")
+        # When the limit is reached, the best allocation found so far is shown and marked as not proven optimal.
+        self.time_limit_entry = ttk.Spinbox(solver_frame, from_=1, to=3600, increment=10, width=6)
+        self.time_limit_entry.grid(row=1, column=1, padx=5, pady=2)
+        self.time_limit_entry.set(DEFAULT_TIME_LIMIT)
 
         # --- Solve Button ---
-        solve_button = ttk.Button(self.left_frame, text="Solve Allocation", command=self.solve_and_display)
-        solve_button.grid(row=4, column=0, padx=10, pady=10)
+        self.solve_button = ttk.Button(self.left_frame, text="Solve Allocation", command=self.solve_and_display)
+        self.solve_button.grid(row=5, column=0, padx=10, pady=10)
+        self.bind("<Control-Return>", lambda event: self.solve_and_display())
 
         # --- Results Text Area (in the right frame) ---
         self.result_text = tk.Text(self.right_frame, width=90, height=40)
         self.result_text.pack(expand=True, fill="both")
+        # The text currently shown, so that showing the same text again (e.g. re-solving unchanged inputs) is skipped.
+        self._shown_text = None
 
         self.initialize_result_text()
 
+        # The last solution found, used to warm-start the next solve.
+        self.last_sol = None
+        # Outcomes of background solves, handed from the solver thread to the Tk thread.
+        self._results = queue.Queue()
+
+        # Build the solver for the default inputs while the user looks at the window, so the first solve
+        # only pays for the search.
+        threading.Thread(target=self._prebuild_solver, daemon=True).start()
+
     def initialize_result_text(self):
-        self.result_text.insert(tk.END, " *  The cycle time of the laminator is the combined cycle time of all laminators.\n")
-        self.result_text.insert(tk.END, "    Different laminators may have different cycle times, so we cannot simply multiply\n")
-        self.result_text.insert(tk.END, "    the cycle time of one laminator by the number of laminators.\n")
-        self.result_text.insert(tk.END, "    The number of laminators variable is used to allocate one worker per laminator,\n")
-        self.result_text.insert(tk.END, "    defining the number of laminator operators.\n")
-        self.result_text.insert(tk.END, " **  Efficiency is a measure of how effectively workers perform their tasks.\n")
-        self.result_text.insert(tk.END, "     If the efficiency is 90, it means that when there are 2 workers assigned to a task,\n")
-        self.result_text.insert(tk.END, "     their individual efficiency will be 90%. When there are 3 workers assigned to a task,\n")
-        self.result_text.insert(tk.END, "     their individual efficiency will be 100 * 0.9 * 0.9%.\n")
+        self.show_result(
+            " *  The cycle time of the laminator is the combined cycle time of all laminators.\n"
+            "    Different laminators may have different cycle times, so we cannot simply multiply\n"
+            "    the cycle time of one laminator by the number of laminators.\n"
+            "    The number of laminators variable is used to allocate one worker per laminator,\n"
+            "    defining the number of laminator operators.\n"
+            " **  Efficiency is a measure of how effectively workers perform their tasks.\n"
+            "     If the efficiency is 90, it means that when there are 2 workers assigned to a task,\n"
+            "     their individual efficiency will be 90%. When there are 3 workers assigned to a task,\n"
+            "     their individual efficiency will be 100 * 0.9 * 0.9%.\n"
+        )
+
+    def show_result(self, text):
+        """
+        Replace the contents of the results area with a single insert (each insert triggers a relayout).
+        The area is read-only; it is only enabled for the duration of the update.
+        """
+        if text == self._shown_text:
+            return
+        self._shown_text = text
+        self.result_text.configure(state="normal")
+        self.result_text.delete("1.0", tk.END)
+        self.result_text.insert(tk.END, text)
+        self.result_text.configure(state="disabled")
+
+    def _mark_skill_dirty(self, *args):
+        self._skill_dirty = True
+
+    def _update_scrollregion(self, event):
+        """ Fit the scroll region to the contents; skipped when the bounding box did not change. """
+        bbox = self.canvas.bbox("all")
+        if bbox != self._scrollregion:
+            self._scrollregion = bbox
+            self.canvas.configure(scrollregion=bbox)
 
     def _on_mouse_wheel(self, event):
-        self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+        self._pending_wheel[1] += event.delta
+        self._schedule_wheel_flush()
 
     def _on_shift_mouse_wheel(self, event):
-        self.canvas.xview_scroll(int(-1*(event.delta/120)), "units")
+        self._pending_wheel[0] += event.delta
+        self._schedule_wheel_flush()
+
+    def _schedule_wheel_flush(self):
+        if not self._wheel_flush_scheduled:
+            self._wheel_flush_scheduled = True
+            self.after_idle(self._flush_wheel)
+
+    def _flush_wheel(self):
+        """ Scroll by the accumulated wheel deltas (120 per notch); a remainder of less than a notch is kept. """
+        self._wheel_flush_scheduled = False
+        for axis, view_scroll in enumerate((self.canvas.xview_scroll, self.canvas.yview_scroll)):
+            units = int(-1*(self._pending_wheel[axis]/120))
+            if units:
+                view_scroll(units, "units")
+                self._pending_wheel[axis] += units * 120
     
     def solve_and_display(self):
+        # Ignore the keyboard shortcut while a solve is running.
+        if self.solve_button.instate(["disabled"]):
+            return
+
         # Read automated task cycle times.
         try:
             auto_times = [float(e.get()) for e in self.auto_entries if e.grid_info()['column'] == 1]
         except ValueError:
             messagebox.showerror("Input error", "Enter valid numbers for automated task cycle times.")
             return
+        if not all(math.isfinite(t) and t > 0 for t in auto_times):
+            messagebox.showerror("Input error", "Automated task cycle times must be positive numbers.")
+            return
         
         # Read sequential task base times.
         try:
@@ -486,6 +903,9 @@ class ProductionLineUI(tk.Tk):
         except ValueError:
             messagebox.showerror("Input error", "Enter valid numbers for sequential task base times.")
             return
+        if not all(math.isfinite(t) and t > 0 for t in seq_times):
+            messagebox.showerror("Input error", "Sequential task base times must be positive numbers.")
+            return
         
         # Read the number of laminators
         try:
@@ -500,6 +920,9 @@ class ProductionLineUI(tk.Tk):
         except ValueError:
             messagebox.showerror("Input error", "Enter valid numbers for the minimum number of workers.")
             return
+        if min(min_workers) < 1:
+            messagebox.showerror("Input error", "The minimum number of workers must be at least 1.")
+            return
 
         # Read the maximum number of workers for each sequential task
         try:
@@ -513,67 +936,141 @@ class ProductionLineUI(tk.Tk):
         except ValueError:
             messagebox.showerror("Input error", "Enter valid numbers for the efficiency.")
             return
+        if min(efficiency) < 1:
+            messagebox.showerror("Input error", "The efficiency must be at least 1%.")
+            return
             
-        # Read the worker skill matrix.
-        skill_matrix = []
-        for i in range(default_num_workers):
-            row = []
-            for m in range(len(tasks_for_model)):
-                row.append(bool(self.skill_vars[i][m].get()))
-            skill_matrix.append(row)
+        # Read the number of parallel search workers.
+        try:
+            num_search_workers = int(self.search_workers_entry.get())
+        except ValueError:
+            messagebox.showerror("Input error", "Enter a valid number of search workers.")
+            return
+        if num_search_workers < 1:
+            messagebox.showerror("Input error", "The number of search workers must be at least 1.")
+            return
+
+        # Read the time limit of the solve.
+        try:
+            time_limit = float(self.time_limit_entry.get())
+        except ValueError:
+            messagebox.showerror("Input error", "Enter a valid time limit.")
+            return
+        if not (math.isfinite(time_limit) and time_limit > 0):
+            messagebox.showerror("Input error", "The time limit must be a positive number of seconds.")
+            return
+            
+        # Read the worker skill matrix, unless no checkbox changed since the last read.
+        # (The Solve button is disabled while a solve runs, so the arrays are not overwritten during a solve.)
+        if self._skill_dirty:
+            self._skill_np[...] = read_vars(self._skill_var_array)
+            self._skill_dirty = False
+        skill_matrix = self._skill_np
         
         # Read worker preferences.
-        pref_list = [bool(self.pref_vars[i].get()) for i in range(default_num_workers)]
+        self._pref_np[...] = read_vars(self._pref_var_array)
+        pref_list = self._pref_np
         
-        # Solve the model.
-        sol = solve_model(seq_times, auto_times, skill_matrix, pref_list, num_laminators, min_workers, max_workers, 50, efficiency)
-        self.result_text.delete("1.0", tk.END)
+        # Reject skill matrices that cannot staff every task before invoking the solver.
+        problem = check_staffing(skill_matrix, min_workers, num_laminators)
+        if problem is not None:
+            self.show_result(f"No feasible solution found: {problem}\n")
+            return
+
+        # Solve the model in a background thread so the window stays responsive during the search.
+        # The inputs are plain values read above; the thread does not touch any widget, it only posts its
+        # outcome to self._results, which the Tk thread polls (_poll_result).
+        self.solve_button.state(["disabled"])
+        self.show_result("Solving...\n")
+        hint = None if self.last_sol is None else self.last_sol["assignment"]
+        threading.Thread(target=self._bg_solve, daemon=True,
+                         args=((seq_times, auto_times, skill_matrix, pref_list, num_laminators, min_workers, max_workers, 50, efficiency),
+                               {"cpsat_params": {"num_search_workers": num_search_workers}, "hint": hint, "time_limit": time_limit},
+                               seq_times, pref_list)).start()
+        self.after(RESULT_POLL_MS, self._poll_result)
+
+    def _prebuild_solver(self):
+        """ Fill the solver cache for the default inputs, i.e. the values the widgets are initialized with. """
+        cached_solver(default_seq_times, default_auto_times, np.array(skill_matrix, dtype=bool), default_num_laminators,
+                      default_min_workers, default_max_workers, 50, [100] * len(sequential_tasks))
+
+    def _bg_solve(self, args, kwargs, seq_times, pref_list):
+        """ Run solve_model off the Tk thread and queue the solution, or the error it raised, for the Tk thread. """
+        sol, error = None, None
+        try:
+            sol = solve_model(*args, **kwargs)
+        except Exception as e:
+            error = e
+        finally:
+            self._results.put((sol, error, seq_times, pref_list))
+
+    def _poll_result(self):
+        """ Wait (on the Tk thread) for the outcome of _bg_solve and display it; the Solve button is re-enabled in any case. """
+        try:
+            sol, error, seq_times, pref_list = self._results.get_nowait()
+        except queue.Empty:
+            self.after(RESULT_POLL_MS, self._poll_result)
+            return
+        try:
+            if isinstance(error, TimeoutError):
+                self.show_result(f"{error}\n")
+            elif error is not None:
+                self.show_result(f"The solver failed: {type(error).__name__}: {error}\n")
+            else:
+                self._render_solution(sol, seq_times, pref_list)
+        finally:
+            self.solve_button.state(["!disabled"])
+
+    def _render_solution(self, sol, seq_times, pref_list):
         if sol is None:
-            self.result_text.insert(tk.END, "No feasible solution found.\n")
-        else:
-            # Display the bottleneck cycle time.
-            T_frac = sol["T"]
-            T_float = float(T_frac)
-            self.result_text.insert(tk.END, f"Bottleneck cycle time: T = {T_frac} (~{T_float:.2f})\n")
-            self.result_text.insert(tk.END, f"Total workers used: {sol['total_workers']}\n\n")
-            
-            # For each task, display assignment details.
-            n_seq = len(sequential_tasks)
-            for m, task in enumerate(tasks_for_model):
-                assigned_workers = []
-                for i in range(default_num_workers):
-                    if sol["assignment"][i, m] == 1:
-                        if sol["occupation"][i][m] > 0:
-                            assigned_workers.append(f'{worker_names[i]} ({sol["occupation"][i][m]}%)')
-                        else:
-                            assigned_workers.append(worker_names[i])
-                if m < n_seq:
-                    # For sequential tasks, display effective time and occupation.
-                    eff_time = seq_times[m] / sol["x"][m]
-                    self.result_text.insert(tk.END,
-                        f"Task: {task}\n"
-                        f"  Base time: {seq_times[m]} -> Workers assigned: {sol['x'][m]}, "
-                        f"Effective time: {eff_time:.2f} (<= {T_float})\n"
-                        f"  Assigned worker(s): {', '.join(assigned_workers) if assigned_workers else 'None'}\n\n"
-                    )
-                else:
-                    # For non-sequential tasks, note that exactly one worker is assigned.
-                    self.result_text.insert(tk.END,
-                        f"Task: {task} (Non-sequential)\n"
-                        f"  Assigned worker(s): {', '.join(assigned_workers) if assigned_workers else 'None'}\n\n"
-                    )
-            
-            # Overall worker usage.
-            self.result_text.insert(tk.END, "Worker Usage:\n")
-            for i in range(default_num_workers):
-                used_str = "USED" if sol["used"][i] == 1 else "not used"
-                pref_str = " (preferred)" if self.pref_vars[i].get() == 1 else ""
-                total_occupation = sum(sol["occupation"][i])
-                if total_occupation != 0:
-                    self.result_text.insert(tk.END, f"  {worker_names[i]}: {used_str}{pref_str}, Total Occupation: {total_occupation}%\n")
-                else:
-                    self.result_text.insert(tk.END, f"  {worker_names[i]}: {used_str}{pref_str}\n")
-                
+            self.show_result("No feasible solution found.\n")
+            return
+        self.last_sol = sol
+
+        # The result text is collected in parts and inserted at once.
+        parts = []
+        if not sol["optimal"]:
+            parts.append("Time limit reached: this allocation is the best one found, but it is not proven optimal.\n\n")
+        # Display the bottleneck cycle time.
+        T_float = sol["T"]
+        parts.append(f"Bottleneck cycle time: T = {T_float:.2f}\n")
+        parts.append(f"Total workers used: {sol['total_workers']}\n\n")
+
+        # For each task, display assignment details.
+        n_seq = len(sequential_tasks)
+        occupation = sol["occupation"]
+        eff_times = np.asarray(seq_times) / sol["x"][:n_seq]
+        for m, task in enumerate(tasks_for_model):
+            assigned_workers = [f'{worker_names[i]} ({occupation[i, m]}%)' if occupation[i, m] > 0 else worker_names[i]
+                                for i in np.flatnonzero(sol["assignment"][:, m])]
+            if m < n_seq:
+                # For sequential tasks, display effective time and occupation.
+                parts.append(
+                    f"Task: {task}\n"
+                    f"  Base time: {seq_times[m]} -> Workers assigned: {sol['x'][m]}, "
+                    f"Effective time: {eff_times[m]:.2f} (<= {T_float})\n"
+                    f"  Assigned worker(s): {', '.join(assigned_workers) if assigned_workers else 'None'}\n\n"
+                )
+            else:
+                # For non-sequential tasks, note that exactly one worker is assigned.
+                parts.append(
+                    f"Task: {task} (Non-sequential)\n"
+                    f"  Assigned worker(s): {', '.join(assigned_workers) if assigned_workers else 'None'}\n\n"
+                )
+
+        # Overall worker usage.
+        parts.append("Worker Usage:\n")
+        # The usage lines are assembled column by column with NumPy string operations.
+        total_occupations = occupation.sum(axis=1)
+        used_str = np.where(np.asarray(sol["used"], dtype=bool), ": USED", ": not used")
+        pref_str = np.where(np.asarray(pref_list, dtype=bool), " (preferred)", "")
+        occupation_str = np.where(total_occupations != 0, np.char.add(np.char.add(", Total Occupation: ", total_occupations.astype(str)), "%"), "")
+        usage_lines = np.char.add("  ", worker_names_arr)
+        for column in (used_str, pref_str, occupation_str):
+            usage_lines = np.char.add(usage_lines, column)
+        parts.append("\n".join(usage_lines) + "\n")
+        self.show_result("".join(parts))
+
 
 if __name__ == "__main__":
     app = ProductionLineUI()
@@ -0,0 +1,61 @@
+"""
+Sweep a few CP-SAT parameters over several instances of TSP_cop.py and report the solve times.
+
+The default instance solves in a fraction of a second with any setting, so it cannot tell the settings
+apart; the sweep also covers instances with a tight cycle time and a non-trivial preference objective,
+where all three lexicographic phases have work to do. The combination with the lowest total time over all
+instances is a candidate for SOLVER_PARAMS. Every run uses a fresh solver (the build_solver cache is cleared)
+so the timings include the full search. A run that hits TIME_LIMIT counts with the full limit.
+"""
+
+import itertools
+import time
+
+import TSP_cop as tsp
+
+REPEATS = 3
+TIME_LIMIT = 60  # seconds per run
+
+def every_third_preferred():
+    return [i % 3 == 0 for i in range(tsp.default_num_workers)]
+
+# name: (auto_times, preferred_list)
+INSTANCES = {
+    "default": (tsp.default_auto_times, [False] * tsp.default_num_workers),
+    "preferences": (tsp.default_auto_times, every_third_preferred()),
+    "tight cycle": ([3.2, 4.1, 6.0], every_third_preferred()),
+}
+
+def solve_instance(auto_times, preferred_list, cpsat_params):
+    tsp.build_solver.cache_clear()
+    start = time.perf_counter()
+    try:
+        sol = tsp.solve_model(tsp.default_seq_times, auto_times, tsp.skill_matrix,
+                              preferred_list, tsp.default_num_laminators,
+                              tsp.default_min_workers, tsp.default_max_workers, 50,
+                              [100] * len(tsp.sequential_tasks), cpsat_params=cpsat_params, time_limit=TIME_LIMIT)
+    except TimeoutError:
+        return TIME_LIMIT, None, False
+    return time.perf_counter() - start, sol, sol is None or sol["optimal"]
+
+if __name__ == "__main__":
+    results = []
+    for linearization_level, optimize_with_core in itertools.product([0, 1, 2], [True, False]):
+        params = dict(linearization_level=linearization_level, optimize_with_core=optimize_with_core)
+        total = 0.0
+        for name, (auto_times, preferred_list) in INSTANCES.items():
+            times = []
+            all_optimal = True
+            for _ in range(REPEATS):
+                elapsed, sol, optimal = solve_instance(auto_times, preferred_list, params)
+                times.append(elapsed)
+                all_optimal = all_optimal and optimal
+            workers = sol["total_workers"] if sol is not None else "none found" if not optimal else "infeasible"
+            status = "" if all_optimal else f" (time limit of {TIME_LIMIT}s reached)"
+            print(f"{params} {name}: best {min(times):.2f}s over {REPEATS} runs, total workers {workers}{status}")
+            total += min(times)
+        results.append((total, params))
+        print(f"{params}: total {total:.2f}s")
+
+    best_time, best_params = min(results, key=lambda r: r[0])
+    print(f"Fastest: {best_params} ({best_time:.2f}s in total)")